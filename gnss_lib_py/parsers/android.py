@@ -541,7 +541,15 @@ class AndroidRawAccel(NavData):
 
         self.sensor_fields = sensor_fields
         pd_df = self.preprocess(input_path)
-        super().__init__(pandas_df=pd_df)
+        super().__init__()
+        self.from_pandas_df(pd_df)
+
+        if len(self) > 0:
+            # logs only contain some of the sensor rows in the row map
+            row_map = {k:v for k,v in self._row_map().items()
+                       if k in self.rows}
+            self.rename(row_map, inplace=True)
+            self.postprocess()
 
     def preprocess(self, input_path):
         """Read Android raw file and produce Accel dataframe objects.
@@ -601,7 +609,8 @@ class AndroidRawAccel(NavData):
         # add gps milliseconds
         self["gps_millis"] = unix_to_gps_millis(self["unix_millis"])
 
-    def _row_map(self):
+    @staticmethod
+    def _row_map():
         """Map of row names from loaded to gnss_lib_py standard
 
         Returns
@@ -622,7 +631,6 @@ class AndroidRawAccel(NavData):
                    'BiasYMps2' : 'acc_bias_y_mps2',
                    'BiasZMps2' : 'acc_bias_z_mps2',
                    }
-        row_map = {k:v for k,v in row_map.items() if k in self.rows}
         return row_map
 
 class AndroidRawGyro(AndroidRawAccel):
@@ -638,7 +646,8 @@ class AndroidRawGyro(AndroidRawAccel):
         sensor_fields = ("UncalGyro","Gyro")
         super().__init__(input_path, sensor_fields=sensor_fields)
 
-    def _row_map(self):
+    @staticmethod
+    def _row_map():
         """Map of row names from loaded to gnss_lib_py standard
 
         Returns
@@ -659,7 +668,6 @@ class AndroidRawGyro(AndroidRawAccel):
                    'DriftYMps2' : 'ang_vel_drift_y_radps',
                    'DriftZMps2' : 'ang_vel_drift_z_radps',
                    }
-        row_map = {k:v for k,v in row_map.items() if k in self.rows}
         return row_map
 
 class AndroidRawMag(AndroidRawAccel):
@@ -675,7 +683,8 @@ class AndroidRawMag(AndroidRawAccel):
         sensor_fields = ("UncalMag","Mag")
         super().__init__(input_path, sensor_fields=sensor_fields)
 
-    def _row_map(self):
+    @staticmethod
+    def _row_map():
         """Map of row names from loaded to gnss_lib_py standard
 
         Returns
@@ -696,7 +705,6 @@ class AndroidRawMag(AndroidRawAccel):
                    'BiasYMicroT' : 'mag_bias_y_microt',
                    'BiasZMicroT' : 'mag_bias_z_microt',
                    }
-        row_map = {k:v for k,v in row_map.items() if k in self.rows}
         return row_map
 
 class AndroidRawOrientation(AndroidRawAccel):
@@ -712,7 +720,8 @@ class AndroidRawOrientation(AndroidRawAccel):
         sensor_fields = ("OrientationDeg")
         super().__init__(input_path, sensor_fields=sensor_fields)
 
-    def _row_map(self):
+    @staticmethod
+    def _row_map():
         """Map of row names from loaded to gnss_lib_py standard
 
         Returns
@@ -727,5 +736,4 @@ class AndroidRawOrientation(AndroidRawAccel):
                    'rollDeg' : 'roll_rx_deg',
                    'pitchDeg' : 'pitch_rx_deg',
                    }
-        row_map = {k:v for k,v in row_map.items() if k in self.rows}
         return row_map
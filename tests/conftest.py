@@ -7,6 +7,9 @@ __date__ = "30 Apr 2022"
 
 
 import os
+import copy
+import pathlib
+
 import pytest
 import numpy as np
 import pandas as pd
@@ -49,19 +52,16 @@ def pytest_collection_modifyitems(items):
 
     items[:] = sorted_items
 
-@pytest.fixture(name="root_path")
+@pytest.fixture(name="root_path", scope="session")
 def fixture_root_path():
     """Location of unit test directory.
 
     Returns
     -------
-    root_path : string
+    root_path : pathlib.Path
         Folder location of unit test measurements
     """
-    root_path = os.path.dirname(
-                os.path.dirname(
-                os.path.realpath(__file__)))
-    root_path = os.path.join(root_path, 'data/unit_test')
+    root_path = pathlib.Path(__file__).resolve().parents[1] / 'data/unit_test'
     return root_path
 
 @pytest.fixture(name="derived_path")
@@ -70,12 +70,12 @@ def fixture_derived_path(root_path):
 
     Parameters
     ----------
-    root_path : string
+    root_path : pathlib.Path
         Folder location of unit test measurements
 
     Returns
     -------
-    derived_path : string
+    derived_path : pathlib.Path
         Location for the unit_test Android derived measurements
 
     Notes
@@ -92,8 +92,7 @@ def fixture_derived_path(root_path):
         Satellite Division of The Institute of Navigation (ION GNSS+
         2020). 2020.
     """
-    derived_path = os.path.join(root_path, 'google_decimeter_2022',
-                                'device_gnss.csv')
+    derived_path = root_path / 'google_decimeter_2022' / 'device_gnss.csv'
     return derived_path
 
 
@@ -103,12 +102,12 @@ def fixture_gt_2022_path(root_path):
 
     Parameters
     ----------
-    root_path : string
+    root_path : pathlib.Path
         Folder location of unit test measurements
 
     Returns
     -------
-    gt_2022_path : string
+    gt_2022_path : pathlib.Path
         Location for the ground truth of the test Android derived measurements.
 
     Notes
@@ -125,8 +124,7 @@ def fixture_gt_2022_path(root_path):
         Satellite Division of The Institute of Navigation (ION GNSS+
         2020). 2020.
     """
-    gt_2022_path = os.path.join(root_path, 'google_decimeter_2022',
-                            'ground_truth.csv')
+    gt_2022_path = root_path / 'google_decimeter_2022' / 'ground_truth.csv'
     return gt_2022_path
 
 
@@ -136,15 +134,15 @@ def fixture_ephemeris_path(root_path):
 
     Parameters
     ----------
-    root_path : string
+    root_path : pathlib.Path
         Path where all unit testing data is stored.
 
     Returns
     -------
-    ephemeris_path : string
+    ephemeris_path : pathlib.Path
         Path where ephemeris files are to be stored.
     """
-    ephemeris_path = os.path.join(root_path)
+    ephemeris_path = root_path
     return ephemeris_path
 
 @pytest.fixture(name="android_derived")
@@ -153,7 +151,7 @@ def fixture_derived(derived_path):
 
     Parameters
     ----------
-    derived_path : string
+    derived_path : pathlib.Path
         Location where file containing measurements is stored.
 
     Returns
@@ -239,7 +237,7 @@ def fixture_gt(gt_2022_path):
 
     Parameters
     ----------
-    gt_2022_path : string
+    gt_2022_path : pathlib.Path
         Path where ground truth file is stored.
 
     Returns
@@ -290,7 +288,7 @@ def fixture_all_gps_ephem(ephemeris_path, start_time, all_gps_sats):
 
     Parameters
     ----------
-    ephemeris_path : string
+    ephemeris_path : pathlib.Path
         Path where ephemeris files are to be stored.
     start_time : float
         Time at which measurements were first received in this trace, as
@@ -389,12 +387,12 @@ def fixture_sp3_path(root_path):
 
     Parameters
     ----------
-    root_path : string
+    root_path : pathlib.Path
         Folder location containing measurements
 
     Returns
     -------
-    sp3_path : string
+    sp3_path : pathlib.Path
         String with location for the unit_test sp3 measurements
 
     Notes
@@ -408,7 +406,7 @@ def fixture_sp3_path(root_path):
     .. [4]  https://cddis.nasa.gov/Data_and_Derived_Products/GNSS/gnss_mgex.html
             Accessed as of August 2, 2022
     """
-    sp3_path = os.path.join(root_path, 'sp3/grg21553.sp3')
+    sp3_path = root_path / 'sp3/grg21553.sp3'
     return sp3_path
 
 @pytest.fixture(name="clk_path")
@@ -417,12 +415,12 @@ def fixture_clk_path(root_path):
 
     Parameters
     ----------
-    root_path : string
+    root_path : pathlib.Path
         Folder location containing measurements
 
     Returns
     -------
-    clk_path : string
+    clk_path : pathlib.Path
         String with location for the unit_test clk measurements
 
     Notes
@@ -437,7 +435,7 @@ def fixture_clk_path(root_path):
             Accessed as of August 2, 2022
 
     """
-    clk_path = os.path.join(root_path, 'clk/grg21553.clk')
+    clk_path = root_path / 'clk/grg21553.clk'
     return clk_path
 
 def fixture_csv_path(csv_filepath):
@@ -631,14 +629,19 @@ def fixture_add_dataframe():
     add_df = pd.DataFrame(data=add_data)
     return add_df
 
-@pytest.fixture(name="derived_2021")
-def fixture_derived_2021_path(root_path):
-    """Filepath of Android Derived measurements
+@pytest.fixture(name="derived_path_2021", scope="session")
+def fixture_derived_path_2021(root_path):
+    """Filepath of Android Derived 2021 measurements
+
+    Parameters
+    ----------
+    root_path : pathlib.Path
+        Path of testing dataset root path
 
     Returns
     -------
-    derived_2021 : AndroidDerived2021
-        Instance of AndroidDerived2021 for testing
+    derived_path_2021 : pathlib.Path
+        Location for the unit_test Android derived measurements
 
     Notes
     -----
@@ -655,10 +658,128 @@ def fixture_derived_2021_path(root_path):
         Satellite Division of The Institute of Navigation (ION GNSS+
         2020). 2020.
     """
-    derived_path = os.path.join(root_path, 'google_decimeter_2021',
-                                'Pixel4_derived.csv')
+    derived_path_2021 = root_path / 'google_decimeter_2021' \
+                      / 'Pixel4_derived.csv'
+    return derived_path_2021
+
+@pytest.fixture(name="android_raw_path", scope="session")
+def fixture_raw_path(root_path):
+    """Filepath of Android Raw measurements
 
-    derived_2021 = AndroidDerived2021(derived_path)
+    Parameters
+    ----------
+    root_path : pathlib.Path
+        Path of testing dataset root path
+
+    Returns
+    -------
+    raw_path : pathlib.Path
+        Location for text log file with Android Raw measurements
+
+    Notes
+    -----
+    Test data is a subset of the Android Raw Measurement Dataset [8]_,
+    particularly the train/2020-05-14-US-MTV-1/Pixel4 trace. The dataset
+    was retrieved from
+    https://www.kaggle.com/c/google-smartphone-decimeter-challenge/data
+
+    References
+    ----------
+    .. [8] Fu, Guoyu Michael, Mohammed Khider, and Frank van Diggelen.
+        "Android Raw GNSS Measurement Datasets for Precise Positioning."
+        Proceedings of the 33rd International Technical Meeting of the
+        Satellite Division of The Institute of Navigation (ION GNSS+
+        2020). 2020.
+    """
+    raw_path = root_path / 'google_decimeter_2021' / 'Pixel4_GnssLog.txt'
+    return raw_path
+
+@pytest.fixture(name="android_raw_2023_path", scope="session")
+def fixture_raw_2023_path(root_path):
+    """Filepath of Android Raw 2023 measurements
+
+    Parameters
+    ----------
+    root_path : pathlib.Path
+        Path of testing dataset root path
+
+    Returns
+    -------
+    raw_path : pathlib.Path
+        Location for text log file with Android Raw measurements
+
+    Notes
+    -----
+    Test data is a subset of the 2023 Google Challenge [7]_.
+
+    References
+    ----------
+    .. [7] https://www.kaggle.com/competitions/smartphone-decimeter-2023/overview
+
+    """
+    raw_path = root_path / 'google_decimeter_2023' \
+             / '2023-09-07-18-59-us-ca' / 'pixel7pro' / 'gnss_log.txt'
+    return raw_path
+
+@pytest.fixture(name="android_derived_2023_path", scope="session")
+def fixture_derived_2023_path(root_path):
+    """Filepath of Android Derived 2023 measurements
+
+    Parameters
+    ----------
+    root_path : pathlib.Path
+        Path of testing dataset root path
+
+    Returns
+    -------
+    derived_path : pathlib.Path
+        Location for the unit_test Android derived measurements
+
+    Notes
+    -----
+    Test data is a subset of the 2023 Google Challenge, from the same
+    trace as ``android_raw_2023_path``.
+
+    """
+    derived_path = root_path / 'google_decimeter_2023' \
+                 / '2023-09-07-18-59-us-ca' / 'pixel7pro' / 'device_gnss.csv'
+    return derived_path
+
+@pytest.fixture(name="derived_2021_session", scope="session")
+def fixture_derived_2021_session(derived_path_2021):
+    """Load Android Derived measurements once per test session.
+
+    Tests should request ``derived_2021`` instead, which returns an
+    independent copy that is safe to modify.
+
+    Parameters
+    ----------
+    derived_path_2021 : pathlib.Path
+        Location for the unit_test Android derived measurements
+
+    Returns
+    -------
+    derived_2021_session : AndroidDerived2021
+        Shared instance of AndroidDerived2021
+    """
+    derived_2021_session = AndroidDerived2021(derived_path_2021)
+    return derived_2021_session
+
+@pytest.fixture(name="derived_2021")
+def fixture_derived_2021(derived_2021_session):
+    """Copy of the session instance of Android Derived measurements.
+
+    Parameters
+    ----------
+    derived_2021_session : AndroidDerived2021
+        Shared instance of AndroidDerived2021
+
+    Returns
+    -------
+    derived_2021 : AndroidDerived2021
+        Instance of AndroidDerived2021 for testing
+    """
+    derived_2021 = copy.deepcopy(derived_2021_session)
     return derived_2021
 
 @pytest.fixture(name="derived_path_xl")
@@ -667,12 +788,12 @@ def fixture_derived_path_xl(root_path):
 
     Parameters
     ----------
-    root_path : string
+    root_path : pathlib.Path
         Path of testing dataset root path
 
     Returns
     -------
-    derived_path : string
+    derived_path : pathlib.Path
         Location for the unit_test Android derived measurements
 
     Notes
@@ -690,8 +811,8 @@ def fixture_derived_path_xl(root_path):
         Satellite Division of The Institute of Navigation (ION GNSS+
         2020). 2020.
     """
-    derived_path = os.path.join(root_path, 'google_decimeter_2021',
-                                'Pixel4XL_derived.csv')
+    derived_path = root_path / 'google_decimeter_2021' \
+                 / 'Pixel4XL_derived.csv'
     return derived_path
 
 @pytest.fixture(name="derived_xl")
@@ -716,10 +837,15 @@ def fixture_load_derived_xl(derived_path_xl):
 def fixture_derived_2022_path(root_path):
     """Filepath of Android Derived measurements
 
+    Parameters
+    ----------
+    root_path : pathlib.Path
+        Folder location containing measurements
+
     Returns
     -------
-    root_path : string
-        Folder location containing measurements
+    derived_path : pathlib.Path
+        Location for the unit_test Android derived measurements
 
     Notes
     -----
@@ -737,8 +863,7 @@ def fixture_derived_2022_path(root_path):
         Satellite Division of The Institute of Navigation (ION GNSS+
         2020). 2020.
     """
-    derived_path = os.path.join(root_path, 'google_decimeter_2022',
-                                'device_gnss.csv')
+    derived_path = root_path / 'google_decimeter_2022' / 'device_gnss.csv'
     return derived_path
 
 
@@ -767,7 +892,7 @@ def fixture_load_gtruth(root_path):
 
     Parameters
     ----------
-    root_path : string
+    root_path : pathlib.Path
         Path of testing dataset root path
 
     Returns
@@ -775,9 +900,8 @@ def fixture_load_gtruth(root_path):
     gtruth : AndroidGroundTruth2021
         Instance of AndroidGroundTruth2021 for testing
     """
-    gtruth = AndroidGroundTruth2021(os.path.join(root_path,
-                                 'google_decimeter_2021',
-                                 'Pixel4_ground_truth.csv'))
+    gtruth = AndroidGroundTruth2021(root_path / 'google_decimeter_2021'
+                                    / 'Pixel4_ground_truth.csv')
     return gtruth
 
 @pytest.fixture(name="state_estimate")
@@ -6,7 +6,7 @@ __authors__ = "Derek Knowles"
 __date__ = "30 Oct 2023"
 
 import os
-import csv
+import mmap
 import pathlib
 
 import pytest
@@ -20,38 +20,7 @@ from gnss_lib_py.navdata.navdata import NavData
 
 # pylint: disable=protected-access
 
-@pytest.fixture(name="android_raw_path")
-def fixture_raw_path(root_path):
-    """Filepath of Android Raw measurements
-
-    Parameters
-    ----------
-    root_path : string
-        Path of testing dataset root path
-
-    Returns
-    -------
-    raw_path : string
-        Location for text log file with Android Raw measurements
-
-    Notes
-    -----
-    Test data is a subset of the Android Raw Measurement Dataset [2]_,
-    particularly the train/2020-05-14-US-MTV-1/Pixel4 trace. The dataset
-    was retrieved from
-    https://www.kaggle.com/c/google-smartphone-decimeter-challenge/data
-
-    References
-    ----------
-    .. [2] Fu, Guoyu Michael, Mohammed Khider, and Frank van Diggelen.
-        "Android Raw GNSS Measurement Datasets for Precise Positioning."
-        Proceedings of the 33rd International Technical Meeting of the
-        Satellite Division of The Institute of Navigation (ION GNSS+
-        2020). 2020.
-    """
-    raw_path = os.path.join(root_path, 'google_decimeter_2021',
-                            'Pixel4_GnssLog.txt')
-    return raw_path
+_VALID_FIELDS = frozenset({"Raw", "Accel", "Gyro", "Mag", "Fix"})
 
 @pytest.fixture(name="pixel6_raw_path")
 def fixture_pixel6_raw_path(root_path):
@@ -59,7 +28,7 @@ def fixture_pixel6_raw_path(root_path):
 
     Parameters
     ----------
-    root_path : string
+    root_path : pathlib.Path
         Path of testing dataset root path
 
     Returns
@@ -78,7 +47,7 @@ def fixture_sensors_raw_path(root_path):
 
     Parameters
     ----------
-    root_path : string
+    root_path : pathlib.Path
         Path of testing dataset root path
 
     Returns
@@ -91,64 +60,6 @@ def fixture_sensors_raw_path(root_path):
                             'all_sensors.txt')
     return raw_path
 
-@pytest.fixture(name="android_raw_2023_path")
-def fixture_raw_2023_path(root_path):
-    """Filepath of Android Raw measurements
-
-    Parameters
-    ----------
-    root_path : string
-        Path of testing dataset root path
-
-    Returns
-    -------
-    raw_path : string
-        Location for text log file with Android Raw measurements
-
-    Notes
-    -----
-    Test data is a subset of the 2023 Google Challenge [3]_.
-
-    References
-    ----------
-    .. [3] https://www.kaggle.com/competitions/smartphone-decimeter-2023/overview
-
-    """
-    raw_path = os.path.join(root_path, 'google_decimeter_2023',
-                            '2023-09-07-18-59-us-ca',
-                            'pixel7pro',
-                            'gnss_log.txt')
-    return raw_path
-
-@pytest.fixture(name="android_derived_2023_path")
-def fixture_derived_2023_path(root_path):
-    """Filepath of Android derived measurements
-
-    Parameters
-    ----------
-    root_path : string
-        Path of testing dataset root path
-
-    Returns
-    -------
-    raw_path : string
-        Location for text log file with Android Raw measurements
-
-    Notes
-    -----
-    Test data is a subset of the 2023 Google Challenge [4]_.
-
-    References
-    ----------
-    .. [4] https://www.kaggle.com/competitions/smartphone-decimeter-2023/overview
-
-    """
-    raw_path = os.path.join(root_path, 'google_decimeter_2023',
-                            '2023-09-07-18-59-us-ca',
-                            'pixel7pro',
-                            'device_gnss.csv')
-    return raw_path
-
 @pytest.mark.parametrize('sensor_type',
                         [android.AndroidRawMag,
                          android.AndroidRawGyro,
@@ -285,16 +196,55 @@ def test_fix_raw(android_raw_path):
     with pytest.raises(TypeError):
         android.AndroidRawFixes([])
 
+@pytest.fixture(name="csv_out_dir", scope="session")
+def fixture_csv_out_dir(tmp_path_factory):
+    """Temporary directory for CSV files split from the raw log.
+
+    Parameters
+    ----------
+    tmp_path_factory : pytest.TempPathFactory
+        Session-scoped pytest factory for temporary directories.
+
+    Returns
+    -------
+    csv_out_dir : pathlib.Path
+        Directory where split CSV files are written.
+
+    """
+    csv_out_dir = tmp_path_factory.mktemp("csv_test")
+    return csv_out_dir
+
+@pytest.fixture(name="android_raw_bytes", scope="module")
+def fixture_raw_bytes(android_raw_path):
+    """Memory-mapped contents of the Android Raw measurements log.
+
+    Parameters
+    ----------
+    android_raw_path : pathlib.Path
+        Location for text log file with Android Raw measurements
+
+    Yields
+    ------
+    android_raw_bytes : mmap.mmap
+        Read-only memory map of the text log file.
+
+    """
+    with open(android_raw_path, 'rb') as in_txt:
+        with mmap.mmap(in_txt.fileno(), 0,
+                       access=mmap.ACCESS_READ) as android_raw_bytes:
+            yield android_raw_bytes
+
 def make_csv(input_path, output_directory, field, show_path=False):
     """Write specific data types from a GNSS android log to a CSV.
 
     Parameters
     ----------
-    input_path : string or path-like
-        File location of data file to read.
-    output_directory : string
+    input_path : string or path-like or bytearray or mmap.mmap
+        File location of data file to read, or the already loaded
+        contents of the file.
+    output_directory : string or path-like
         Directory where new csv file should be created
-    field : list of strings
+    field : string
         Type of data to extract. Valid options are either "Raw",
         "Accel", "Gyro", "Mag", or "Fix".
     show_path : bool
@@ -305,6 +255,36 @@ def make_csv(input_path, output_directory, field, show_path=False):
     output_path : string
         New file location of the exported CSV.
 
+    """
+    output_paths = make_csvs(input_path, output_directory, [field],
+                             show_path)
+    return output_paths[field]
+
+def make_csvs(input_path, output_directory, fields, show_path=False):
+    """Write multiple data types from a GNSS android log to CSVs.
+
+    The log is scanned once and each line is dispatched to the CSV of
+    its data type.
+
+    Parameters
+    ----------
+    input_path : string or path-like or bytearray or mmap.mmap
+        File location of data file to read, or the already loaded
+        contents of the file.
+    output_directory : string or path-like
+        Directory where new csv files should be created
+    fields : list of strings
+        Types of data to extract. Valid options are "Raw", "Accel",
+        "Gyro", "Mag", or "Fix".
+    show_path : bool
+        If true, prints output paths.
+
+    Returns
+    -------
+    output_paths : dict
+        New file location of the exported CSV for each field of the
+        form {field : output_path}.
+
     Notes
     -----
     Based off of MATLAB code from Google's gps-measurement-tools
@@ -312,100 +292,225 @@ def make_csv(input_path, output_directory, field, show_path=False):
     with MakeCsv() in opensource/ReadGnssLogger.m
 
     """
-    if not os.path.isdir(output_directory): #pragma: no cover
-        os.makedirs(output_directory)
-    output_path = os.path.join(output_directory, field + ".csv")
-    with open(output_path, 'w', encoding="utf8") as out_csv:
-        writer = csv.writer(out_csv)
-
-        if not isinstance(input_path, (str, os.PathLike)):
-            raise TypeError("input_path must be string or path-like")
-        if not os.path.exists(input_path):
-            raise FileNotFoundError(input_path,"file not found")
-
-        with open(input_path, 'r', encoding="utf8") as in_txt:
-            for line in in_txt:
-                # Comments in the log file
-                if line[0] == '#':
-                    # Remove initial '#', spaces, trailing newline
-                    # and split using commas as delimiter
-                    line_data = line[2:].rstrip('\n').replace(" ","").split(",")
-                    if line_data[0] == field:
-                        writer.writerow(line_data[1:])
-                # Data in file
-                else:
-                    # Remove spaces, trailing newline and split using commas as delimiter
-                    line_data = line.rstrip('\n').replace(" ","").split(",")
-                    if line_data[0] == field:
-                        writer.writerow(line_data[1:])
-    if show_path: #pragma: no cover
-        print(output_path)
-
-    return output_path
+    for field in fields:
+        if field not in _VALID_FIELDS:
+            raise ValueError("field must be one of "
+                           + str(sorted(_VALID_FIELDS)))
+    rows = _read_log_rows(input_path, fields)
+    os.makedirs(output_directory, exist_ok=True)
+
+    output_paths = {}
+    for field in fields:
+        output_path = os.path.join(output_directory, field + ".csv")
+        with open(output_path, 'wb') as out_csv:
+            if rows[field]:
+                # same line terminator as the csv module writes
+                out_csv.write(b"\r\n".join(rows[field]) + b"\r\n")
+        if show_path: #pragma: no cover
+            print(output_path)
+        output_paths[field] = output_path
+
+    return output_paths
+
+def _read_log_rows(input_path, fields):
+    """Read the csv rows of multiple data types from a GNSS android log.
+
+    Parameters
+    ----------
+    input_path : string or path-like or bytearray or mmap.mmap
+        File location of data file to read, or the already loaded
+        contents of the file.
+    fields : list of strings
+        Types of data to extract.
+
+    Returns
+    -------
+    rows : dict
+        Rows of bytes for each field of the form {field : rows}.
+
+    """
+    if isinstance(input_path, (bytearray, mmap.mmap)):
+        return _split_log_rows(input_path, fields)
+    if not isinstance(input_path, (str, os.PathLike)):
+        raise TypeError("input_path must be string, path-like, "
+                      + "bytearray or mmap.mmap")
+    if not os.path.exists(input_path):
+        raise FileNotFoundError(input_path,"file not found")
+    rows = {field : [] for field in fields}
+    with open(input_path, 'rb') as in_txt:
+        if os.fstat(in_txt.fileno()).st_size > 0:
+            with mmap.mmap(in_txt.fileno(), 0,
+                           access=mmap.ACCESS_READ) as in_mmap:
+                rows = _split_log_rows(in_mmap, fields)
+    return rows
+
+def _split_log_rows(log_buffer, fields):
+    """Split the csv rows of multiple data types from a GNSS android log.
+
+    The buffer is scanned once, line by line, without first copying the
+    whole buffer.
+
+    Parameters
+    ----------
+    log_buffer : bytearray or mmap.mmap
+        Contents of the log file.
+    fields : list of strings
+        Types of data to extract.
+
+    Returns
+    -------
+    rows : dict
+        Rows of bytes for each field of the form {field : rows}.
+
+    """
+    # match on raw bytes so lines are never decoded
+    field_rows = {field.encode("utf8") : [] for field in fields}
+    start = 0
+    while start < len(log_buffer):
+        end = log_buffer.find(b"\n", start)
+        if end == -1:
+            end = len(log_buffer)
+        raw_line = bytes(log_buffer[start:end])
+        start = end + 1
+        # Comments in the log file, remove initial '# '
+        if raw_line.startswith(b"# "):
+            raw_line = raw_line[2:]
+        line_field, delimiter, payload = raw_line.partition(b",")
+        if delimiter and line_field in field_rows:
+            # Remove spaces and the '\r' of CRLF line endings, fields
+            # never need csv quoting once those are stripped
+            row = payload.rstrip(b"\r").replace(b" ", b"")
+            field_rows[line_field].append(row)
+    rows = {field : field_rows[field.encode("utf8")] for field in fields}
+    return rows
+
+@pytest.fixture(name="android_raw_csvs", scope="module")
+def fixture_raw_csvs(android_raw_bytes, csv_out_dir):
+    """CSV files split from the Android Raw measurements log.
+
+    Parameters
+    ----------
+    android_raw_bytes : mmap.mmap
+        Memory-mapped contents of the Android Raw measurements log
+    csv_out_dir : pathlib.Path
+        Temporary directory where split csv files are written
+
+    Returns
+    -------
+    android_raw_csvs : dict
+        Location of the exported CSV for each data type of the form
+        {field : csv_path}.
+
+    """
+    android_raw_csvs = make_csvs(android_raw_bytes, csv_out_dir,
+                                 ["Accel", "Gyro", "Fix"])
+    return android_raw_csvs
 
 @pytest.mark.parametrize('file_type',
                         ['Accel',
                         'Gyro',
                         'Fix'])
-def test_csv_equivalence(android_raw_path, root_path, file_type):
+def test_csv_equivalence(android_raw_path, android_raw_csvs,
+                         csv_out_dir, file_type):
     """Test equivalence of loaded measurements and data from split csv
 
     Parameters
     ----------
     android_raw_path : pytest.fixture
         Path to Android Raw measurements text log file
-    root_path : pytest.fixture
-        Path to location of all data for Android unit testing
+    android_raw_csvs : pytest.fixture
+        Location of the csv split from the log for each data type
+    csv_out_dir : pytest.fixture
+        Temporary directory where split csv files are written
     file_type : string
         Type of measurement to be extracted into csv files
 
     """
     #NOTE: Times for gyroscope measurements are overridden by accel times
     # and are not checked in this test for any measurement
-    no_check = ['utcTimeMillis', 'elapsedRealtimeNanos']
+    no_check = {'utcTimeMillis', 'elapsedRealtimeNanos'}
     if file_type == 'Accel':
         test_measure = android.AndroidRawAccel(android_raw_path)
     elif file_type == 'Gyro':
         test_measure = android.AndroidRawGyro(android_raw_path)
     elif file_type=='Fix':
         test_measure = android.AndroidRawFixes(android_raw_path)
-    output_directory = os.path.join(root_path, 'csv_test')
-    csv_loc = make_csv(android_raw_path, output_directory,
-                               file_type)
-    test_df = pd.read_csv(csv_loc)
+    if file_type == 'Fix':
+        # mixed string and numeric columns, use the default parser
+        test_df = pd.read_csv(android_raw_csvs[file_type])
+    else:
+        test_df = pd.read_csv(android_raw_csvs[file_type],
+                              engine="pyarrow")
     row_map = test_measure._row_map()
     for col_name in test_df.columns:
-        if col_name in row_map:
-            row_idx = row_map[col_name]
-        else:
-            row_idx = col_name
-        if col_name in no_check or col_name :
-            break
+        if col_name in no_check:
+            continue
+        row_idx = row_map.get(col_name, col_name)
         measure_slice = test_measure[row_idx, :]
-        df_slice = test_df[col_name].values
-        np.testing.assert_almost_equal(measure_slice, df_slice)
+        df_slice = test_df[col_name].to_numpy()
+        if row_idx == "fix_provider":
+            provider_map = android.AndroidRawFixes._provider_map()
+            df_slice = [provider_map.get(i,"") for i in df_slice]
+        if test_measure.is_str(row_idx):
+            np.testing.assert_array_equal(measure_slice, df_slice)
+        else:
+            np.testing.assert_almost_equal(measure_slice, df_slice)
 
     # raises exception if not a file path
     with pytest.raises(FileNotFoundError):
-        make_csv("", output_directory, file_type)
+        make_csv("", csv_out_dir / "not_created", file_type)
 
     # raises exception if input not string or path-like
     with pytest.raises(TypeError):
-        make_csv([], output_directory, file_type)
+        make_csv([], csv_out_dir / "not_created", file_type)
+    with pytest.raises(TypeError):
+        make_csv(os.fsencode(android_raw_path),
+                 csv_out_dir / "not_created", file_type)
 
-    os.remove(csv_loc)
-    for file in os.listdir(output_directory):
-        os.remove(os.path.join(output_directory, file))
-    os.rmdir(output_directory)
+    # raises exception if field is not a known data type
+    with pytest.raises(ValueError):
+        make_csv(android_raw_path, csv_out_dir / "not_created", "Fixes")
+
+    # failed inputs leave the filesystem untouched
+    assert not os.path.exists(csv_out_dir / "not_created")
+
+def test_csv_line_endings(pixel6_raw_path, csv_out_dir):
+    """Test CRLF and LF logs are split into the same csv files.
+
+    Parameters
+    ----------
+    pixel6_raw_path : pytest.fixture
+        Path to Android Raw measurements text log file with CRLF line
+        endings
+    csv_out_dir : pytest.fixture
+        Temporary directory where split csv files are written
+
+    """
+    fields = sorted(_VALID_FIELDS)
+    with open(pixel6_raw_path, 'rb') as in_txt:
+        crlf_log = bytearray(in_txt.read())
+    assert b"\r\n" in crlf_log
+    lf_log = crlf_log.replace(b"\r\n", b"\n")
+
+    crlf_csvs = make_csvs(pixel6_raw_path, csv_out_dir / "crlf", fields)
+    lf_csvs = make_csvs(lf_log, csv_out_dir / "lf", fields)
+    for field in fields:
+        with open(crlf_csvs[field], 'rb') as crlf_csv:
+            crlf_rows = crlf_csv.read()
+        with open(lf_csvs[field], 'rb') as lf_csv:
+            assert crlf_rows == lf_csv.read()
+        # rows only end with the csv line terminator
+        assert len(crlf_rows) > 0
+        assert b"\r\r" not in crlf_rows
 
 def test_raw_load(android_raw_2023_path, android_derived_2023_path):
     """Test basic loading of android raw file.
 
     Parameters
     ----------
-    android_raw_2023_path : string
+    android_raw_2023_path : pathlib.Path
         Location for text log file with Android Raw measurements.
-    android_derived_2023_path : string
+    android_derived_2023_path : pathlib.Path
         Location for text log file with Android derived measurements.
 
     """
@@ -443,7 +548,7 @@ def test_raw_filters(root_path):
 
     Parameters
     ----------
-    root_path : string
+    root_path : pathlib.Path
         Path of testing dataset root path
 
     """
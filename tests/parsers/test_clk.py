@@ -28,7 +28,7 @@ def fixture_clk_path(root_path):
 
     Parameters
     ----------
-    root_path : string
+    root_path : pathlib.Path
         Folder location containing measurements
 
     Returns
@@ -75,7 +75,7 @@ def fixture_clk_path_missing(root_path):
 
     Parameters
     ----------
-    root_path : string
+    root_path : pathlib.Path
         Folder location containing measurements
 
     Returns
@@ -111,7 +111,7 @@ def fixture_clk_path_nodata(root_path):
 
     Parameters
     ----------
-    root_path : string
+    root_path : pathlib.Path
         Folder location containing measurements
 
     Returns
@@ -1,12 +1,14 @@
 """Tests for Android data loaders.
 
+Loaded measurement fixtures are session-scoped and tests that modify
+them receive copies, so the module can be run in parallel with
+``pytest -n auto``.
+
 """
 
 __authors__ = "Ashwin Kanhere, Derek Knowles"
 __date__ = "10 Nov 2021"
 
-import os
-
 import pytest
 import numpy as np
 import pandas as pd
@@ -19,75 +21,7 @@ from gnss_lib_py.navdata.operations import loop_time, concat
 
 # pylint: disable=protected-access
 
-@pytest.fixture(name="derived_path_2021")
-def fixture_derived_path(root_path):
-    """Filepath of Android Derived measurements
-
-    Parameters
-    ----------
-    root_path : string
-        Path of testing dataset root path
-
-    Returns
-    -------
-    derived_path_2021 : string
-        Location for the unit_test Android derived measurements
-
-    Notes
-    -----
-    Test data is a subset of the Android Raw Measurement Dataset [1]_,
-    particularly the train/2020-05-14-US-MTV-1/Pixel4 trace. The dataset
-    was retrieved from
-    https://www.kaggle.com/c/google-smartphone-decimeter-challenge/data
-
-    References
-    ----------
-    .. [1] Fu, Guoyu Michael, Mohammed Khider, and Frank van Diggelen.
-        "Android Raw GNSS Measurement Datasets for Precise Positioning."
-        Proceedings of the 33rd International Technical Meeting of the
-        Satellite Division of The Institute of Navigation (ION GNSS+
-        2020). 2020.
-    """
-    derived_path_2021 = os.path.join(root_path, 'google_decimeter_2021',
-                                'Pixel4_derived.csv')
-    return derived_path_2021
-
-
-@pytest.fixture(name="android_raw_path")
-def fixture_raw_path(root_path):
-    """Filepath of Android Raw measurements
-
-    Parameters
-    ----------
-    root_path : string
-        Path of testing dataset root path
-
-    Returns
-    -------
-    raw_path : string
-        Location for text log file with Android Raw measurements
-
-    Notes
-    -----
-    Test data is a subset of the Android Raw Measurement Dataset [3]_,
-    particularly the train/2020-05-14-US-MTV-1/Pixel4 trace. The dataset
-    was retrieved from
-    https://www.kaggle.com/c/google-smartphone-decimeter-challenge/data
-
-    References
-    ----------
-    .. [3] Fu, Guoyu Michael, Mohammed Khider, and Frank van Diggelen.
-        "Android Raw GNSS Measurement Datasets for Precise Positioning."
-        Proceedings of the 33rd International Technical Meeting of the
-        Satellite Division of The Institute of Navigation (ION GNSS+
-        2020). 2020.
-    """
-    raw_path = os.path.join(root_path, 'google_decimeter_2021',
-                            'Pixel4_GnssLog.txt')
-    return raw_path
-
-
-@pytest.fixture(name="pd_df")
+@pytest.fixture(name="pd_df", scope="session")
 def fixture_pd_df(derived_path_2021):
     """Load Android derived measurements into dataframe
 
@@ -101,11 +35,37 @@ def fixture_pd_df(derived_path_2021):
     derived_df : pd.DataFrame
         Dataframe with Android Derived measurements
     """
-    derived_df = pd.read_csv(derived_path_2021)
+    derived_df = pd.read_csv(derived_path_2021, engine="pyarrow",
+                             dtype_backend="pyarrow")
     return derived_df
 
 
-@pytest.fixture(name="derived_row_map")
+@pytest.fixture(name="pd_df_arrays", scope="session")
+def fixture_pd_df_arrays(pd_df):
+    """Columns of Android derived measurements as numpy arrays
+
+    Parameters
+    ----------
+    pd_df : pytest.fixture
+        pd.DataFrame for testing measurements
+
+    Returns
+    -------
+    pd_df_arrays : Dict
+        Column arrays of the form {column_name : np.ndarray}
+    """
+    pd_df_arrays = {}
+    for column in pd_df.columns:
+        if pd.api.types.is_numeric_dtype(pd_df[column]):
+            # missing Arrow values become NaN instead of pd.NA objects
+            pd_df_arrays[column] = pd_df[column].to_numpy(dtype=np.float64,
+                                                          na_value=np.nan)
+        else:
+            pd_df_arrays[column] = pd_df[column].to_numpy()
+    return pd_df_arrays
+
+
+@pytest.fixture(name="derived_row_map", scope="session")
 def fixture_inverse_row_map():
     """Map from standard names to derived column names
 
@@ -118,15 +78,16 @@ def fixture_inverse_row_map():
     inverse_row_map = {v : k for k,v in google_decimeter.AndroidDerived2021._row_map().items()}
     return inverse_row_map
 
-def test_derived_df_equivalence(derived_path_2021, pd_df, derived_row_map):
+def test_derived_df_equivalence(derived_path_2021, pd_df_arrays,
+                                derived_row_map):
     """Test if naive dataframe and AndroidDerived2021 contain same data.
 
     Parameters
     ----------
-    derived_path_2021 : string
+    derived_path_2021 : pathlib.Path
         Location for the unit_test Android 2021 derived measurements.
-    pd_df : pytest.fixture
-        pd.DataFrame for testing measurements
+    pd_df_arrays : pytest.fixture
+        Column arrays of the pd.DataFrame for testing measurements
     derived_row_map : pytest.fixture
         Column map to convert standard to original derived column names.
 
@@ -134,30 +95,42 @@ def test_derived_df_equivalence(derived_path_2021, pd_df, derived_row_map):
     # Also tests if strings are being converted back correctly
     derived = google_decimeter.AndroidDerived2021(derived_path_2021,
                                remove_timing_outliers=False)
-    measure_df = derived.pandas_df()
-    measure_df.replace({'gnss_id',"gps"},1,inplace=True)
-    measure_df.replace({'gnss_id',"glonass"},3,inplace=True)
-    measure_df.replace({'gnss_id',"galileo"},6,inplace=True)
-    signal_map = {"GPS_L1" : "l1",
-                  "GPS_L5" : "l5",
-                  "GAL_E1" : "e1",
-                  "GAL_E5A" : "e5a",
-                  "GLO_G1" : "g1",
-                  "QZS_J1" : "j1",
-                  "QZS_J5" : "j5",
-                  "BDS_B1I" : "b1i",
-                  "BDS_B1C" : "b1c",
-                  "BDS_B2A" : "b2a",
+    gnss_id_map = {"gps" : 1,
+                   "glonass" : 3,
+                   "galileo" : 6,
+                  }
+    signal_map = {"l1" : "GPS_L1",
+                  "l5" : "GPS_L5",
+                  "e1" : "GAL_E1",
+                  "e5a" : "GAL_E5A",
+                  "g1" : "GLO_G1",
+                  "j1" : "QZS_J1",
+                  "j5" : "QZS_J5",
+                  "b1i" : "BDS_B1I",
+                  "b1c" : "BDS_B1C",
+                  "b2a" : "BDS_B2A",
                  }
-    for s_key, s_value in signal_map.items():
-        measure_df.replace({'signal_type',s_value},s_key,inplace=True)
-    measure_df.rename(columns=derived_row_map, inplace=True)
-    measure_df = measure_df.drop(columns='corr_pr_m')
-    pd_df = pd_df[pd_df['millisSinceGpsEpoch'] != pd_df.loc[0,'millisSinceGpsEpoch']]
-    pd_df.reset_index(drop=True, inplace=True)
-    pd.testing.assert_frame_equal(pd_df.sort_index(axis=1),
-                                  measure_df.sort_index(axis=1),
-                                  check_dtype=False, check_names=True)
+    millis = pd_df_arrays['millisSinceGpsEpoch']
+    keep = millis != millis[0]
+
+    # corrected pseudorange is computed and has no original column
+    derived_rows = [row for row in derived.rows if row != 'corr_pr_m']
+    assert sorted(derived_row_map.get(row, row) for row in derived_rows) \
+        == sorted(pd_df_arrays)
+
+    for row in derived_rows:
+        expected = pd_df_arrays[derived_row_map.get(row, row)][keep]
+        if row == "gnss_id":
+            measured = [gnss_id_map[value] for value in derived[row]]
+            np.testing.assert_array_equal(measured, expected)
+        elif row == "signal_type":
+            measured = [signal_map[value] for value in derived[row]]
+            np.testing.assert_array_equal(measured, expected)
+        elif derived.is_str(row):
+            np.testing.assert_array_equal(derived[row], expected)
+        else:
+            np.testing.assert_allclose(derived[row], expected,
+                                       equal_nan=True)
 
 
 @pytest.mark.parametrize('row_name, index, value',
@@ -217,14 +190,14 @@ def test_get_and_set_str(derived_2021):
         Instance of AndroidDerived2021 for testing
     """
     key = 'testing123_string'
-    value = ['word']*len(derived_2021)
     derived_size = len(derived_2021)
-    size1 = int(derived_size/2)
-    size2 = (derived_size-int(derived_size/2))
-    value1 = ['ashwin']*size1
-    value2 = ['derek']*size2
-    value = np.concatenate((np.asarray(value1, dtype=object),
-                            np.asarray(value2, dtype=object)))
+    value = np.full(derived_size, 'word', dtype=object)
+    derived_2021[key] = value
+
+    np.testing.assert_equal(derived_2021[key, :], value)
+
+    mask = np.arange(derived_size) >= derived_size // 2
+    value = np.where(mask, 'derek', 'ashwin').astype(object)
     derived_2021[key] = value
 
     np.testing.assert_equal(derived_2021[key, :], value)
@@ -282,7 +255,7 @@ def test_timestep_parsing(derived_path_xl):
 
     Parameters
     ----------
-    derived_path_xl : string
+    derived_path_xl : pathlib.Path
         Location for the unit_test Android derived measurements
 
     """
@@ -343,21 +316,22 @@ def test_android_gtruth(gtruth):
 #### Android Derived 2022 Dataset tests
 ######################################################################
 
-@pytest.fixture(name="root_path_2022")
-def fixture_root_path_2022():
+@pytest.fixture(name="root_path_2022", scope="session")
+def fixture_root_path_2022(root_path):
     """Location of measurements for unit test
 
+    Parameters
+    ----------
+    root_path : pathlib.Path
+        Path of testing dataset root path
+
     Returns
     -------
-    root_path : string
+    root_path_2022 : pathlib.Path
         Folder location containing 2022 measurements
     """
-    root_path = os.path.dirname(
-                os.path.dirname(
-                os.path.dirname(
-                os.path.realpath(__file__))))
-    root_path = os.path.join(root_path, 'data/unit_test/google_decimeter_2022')
-    return root_path
+    root_path_2022 = root_path / 'google_decimeter_2022'
+    return root_path_2022
 
 def test_derived_state_estimate_ext(derived_2022):
     """Tests the state_estimate extracted as a separate NavData.
@@ -395,7 +369,7 @@ def test_gt_2022(gt_2022_path):
 
     Parameters
     ----------
-    gt_2022_path : string
+    gt_2022_path : pathlib.Path
         Location for the unit_test Android ground truth 2022 measurements
     """
     gt_2022 = google_decimeter.AndroidGroundTruth2022(gt_2022_path)
@@ -407,11 +381,11 @@ def test_gt_alt_nan(root_path_2022):
 
     Parameters
     ----------
-    root_path_2022 : string
+    root_path_2022 : pathlib.Path
         Location for the files with missing altitude, including the file
         with missing altitude
     """
-    gt_2022_nan = os.path.join(root_path_2022, 'alt_nan_ground_truth.csv')
+    gt_2022_nan = root_path_2022 / 'alt_nan_ground_truth.csv'
     with pytest.warns(RuntimeWarning):
         gt_2022 = google_decimeter.AndroidGroundTruth2022(gt_2022_nan)
         np.testing.assert_almost_equal(gt_2022['alt_rx_gt_m'],
@@ -422,7 +396,7 @@ def test_remove_all_data(derived_path_xl):
 
     Parameters
     ----------
-    derived_path_xl : string
+    derived_path_xl : pathlib.Path
         Location for the unit_test Android 2021 derived measurements.
 
     """
@@ -487,12 +461,12 @@ def test_solve_kaggle_dataset(root_path):
 
     Parameters
     ----------
-    root_path : string
+    root_path : pathlib.Path
         Path of testing dataset root path
 
     """
 
-    folder_path = os.path.join(root_path,"..")
+    folder_path = root_path.parent
     for solver in [google_decimeter.solve_kaggle_baseline,
                    solve_wls,
                    solve_gnss_ekf,
@@ -517,8 +491,8 @@ def test_solve_kaggle_dataset(root_path):
 #### Android 2023 Dataset tests
 ######################################################################
 
-@pytest.fixture(name="root_path_2023")
-def fixture_root_path_2023():
+@pytest.fixture(name="root_path_2023", scope="session")
+def fixture_root_path_2023(root_path):
     """Location of measurements for unit test
 
     Test data is a subset of the Android Raw Measurement Dataset [7]_,
@@ -528,26 +502,27 @@ def fixture_root_path_2023():
     ----------
     .. [7] https://www.kaggle.com/competitions/smartphone-decimeter-2023
 
+    Parameters
+    ----------
+    root_path : pathlib.Path
+        Path of testing dataset root path
+
     Returns
     -------
-    root_path : string
+    root_path_2023 : pathlib.Path
         Folder location containing 2023 measurements
     """
-    root_path = os.path.dirname(
-                os.path.dirname(
-                os.path.dirname(
-                os.path.realpath(__file__))))
-    root_path = os.path.join(root_path, 'data/unit_test/google_decimeter_2023')
-    return root_path
+    root_path_2023 = root_path / 'google_decimeter_2023'
+    return root_path_2023
 
 @pytest.fixture(name="derived_2023")
-def fixture_derived_2023(root_path_2023):
+def fixture_derived_2023(android_derived_2023_path):
     """Testing that Android Derived 2023 is created without errors.
 
     Parameters
     ----------
-    root_path_2023 : string
-        Folder location containing 2023 measurements
+    android_derived_2023_path : pathlib.Path
+        Location for the unit_test Android derived 2023 measurements
 
     Returns
     -------
@@ -556,11 +531,7 @@ def fixture_derived_2023(root_path_2023):
 
     """
 
-    derived_2023_path= os.path.join(root_path_2023,
-                                    '2023-09-07-18-59-us-ca',
-                                    'pixel7pro',
-                                    'device_gnss.csv')
-    derived_2023 = google_decimeter.AndroidDerived2023(derived_2023_path)
+    derived_2023 = google_decimeter.AndroidDerived2023(android_derived_2023_path)
     assert isinstance(derived_2023, NavData)
     return derived_2023
 
@@ -570,7 +541,7 @@ def fixture_ground_truth_2023(root_path_2023):
 
     Parameters
     ----------
-    root_path_2023 : string
+    root_path_2023 : pathlib.Path
         Folder location containing 2023 measurements
 
     Returns
@@ -580,10 +551,8 @@ def fixture_ground_truth_2023(root_path_2023):
 
     """
 
-    ground_truth_2023_path= os.path.join(root_path_2023,
-                                    '2023-09-07-18-59-us-ca',
-                                    'pixel7pro',
-                                    'ground_truth.csv')
+    ground_truth_2023_path = root_path_2023 / '2023-09-07-18-59-us-ca' \
+                           / 'pixel7pro' / 'ground_truth.csv'
     ground_truth_2023 = google_decimeter.AndroidGroundTruth2023(ground_truth_2023_path)
     assert isinstance(ground_truth_2023, NavData)
     return ground_truth_2023
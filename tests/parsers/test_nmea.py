@@ -25,7 +25,7 @@ def fixture_nmea_file_w_correct_checksum(root_path):
 
     Parameters
     ----------
-    root_path : string
+    root_path : pathlib.Path
         Folder location containing all NMEA files for unit tests.
 
     Returns
@@ -46,7 +46,7 @@ def fixture_nmea_file_w_wrong_checksum(root_path):
 
     Parameters
     ----------
-    root_path : string
+    root_path : pathlib.Path
         Folder location containing all NMEA files for unit tests.
 
     Returns
@@ -67,7 +67,7 @@ def fixture_nmea_file_no_checksum(root_path):
 
     Parameters
     ----------
-    root_path : string
+    root_path : pathlib.Path
         Folder location containing all NMEA files for unit tests.
 
     Returns
@@ -24,7 +24,7 @@ def fixture_rinex_mixed_values(root_path):
 
     Parameters
     ----------
-    root_path : string
+    root_path : pathlib.Path
         Folder location containing all Rinex 3 .o files for unit tests.
 
     Returns
@@ -47,7 +47,7 @@ def fixture_rinex_single_values(root_path):
 
     Parameters
     ----------
-    root_path : string
+    root_path : pathlib.Path
         Folder location containing all Rinex 3 .o files for unit tests.
 
     Returns
@@ -229,7 +229,7 @@ def test_z_tracking(root_path):
 
     Parameters
     ----------
-    root_path : string
+    root_path : pathlib.Path
         Folder location containing all Rinex 3 .o files for unit tests.
 
     """
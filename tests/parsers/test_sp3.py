@@ -28,7 +28,7 @@ def fixture_sp3_path(root_path):
 
     Parameters
     ----------
-    root_path : string
+    root_path : pathlib.Path
         Folder location containing measurements
 
     Returns
@@ -74,7 +74,7 @@ def fixture_sp3_path_missing(root_path):
 
     Parameters
     ----------
-    root_path : string
+    root_path : pathlib.Path
         Folder location containing measurements
 
     Returns
@@ -109,7 +109,7 @@ def fixture_sp3_path_nodata(root_path):
 
     Parameters
     ----------
-    root_path : string
+    root_path : pathlib.Path
         Folder location containing measurements
 
     Returns
@@ -64,19 +64,24 @@ def fixture_all_ephem_paths(ephem_path):
     return all_ephem_paths
 
 @pytest.fixture(name="ephem_download_path", scope='session')
-def fixture_ephem_download_path():
+def fixture_ephem_download_path(tmp_path_factory):
     """Location of ephemeris files for unit test
 
+    A temporary directory is used so that parallel test workers never
+    remove each other's downloads.
+
+    Parameters
+    ----------
+    tmp_path_factory : pytest.TempPathFactory
+        Factory for session scoped temporary directories.
+
     Returns
     -------
     ephem_download_path : string
         Location where ephemeris files are stored/to be downloaded.
     """
-    root_path = os.path.dirname(
-                os.path.dirname(
-                os.path.dirname(
-                os.path.realpath(__file__))))
-    ephem_download_path = os.path.join(root_path, 'data/unit_test/ephemeris_downloader_tests')
+    ephem_download_path = str(tmp_path_factory.mktemp(
+                              'ephemeris_downloader_tests'))
     return ephem_download_path
 
 def remove_download_eph(ephem_download_path):
@@ -636,9 +641,9 @@ def test_valid_ephemeris(all_ephem_paths,sp3_path,clk_path):
     ----------
     all_ephem_paths : string
         Location of all unit test ephemeris files.
-    sp3_path : string
+    sp3_path : pathlib.Path
         String with location for the unit_test sp3 measurements
-    clk_path : string
+    clk_path : pathlib.Path
         String with location for the unit_test clk measurements
 
     """
@@ -240,7 +240,7 @@ def test_add_measures_wrapper(android_measurements, android_state,
     android_state : gnss_lib_py.navdata.navdata.NavData
         Instance of `NavData` containing `gps_millis` and Rx position
         estimates from Android Derived.
-    ephemeris_path : string
+    ephemeris_path : pathlib.Path
         The location where ephemeris files are read from or downloaded to
         if they don't exist.
     iono_params : np.ndarray
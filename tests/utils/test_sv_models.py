@@ -242,7 +242,7 @@ def test_add_sv_state_wrapper(android_measurements, ephemeris_path, error_tol_de
     android_measurements : gnss_lib_py.navdata.navdata.NavData
         NavData instance containing L1 measurements for received GPS
         measurements.
-    ephemeris_path : string
+    ephemeris_path : pathlib.Path
         The location where ephemeris files are read from or downloaded to
         if they don't exist.
     error_tol_dec : Dict
@@ -296,7 +296,7 @@ def test_filter_ephemeris_none(android_gps_l1, ephemeris_path):
     android_gps_l1 : gnss_lib_py.navdata.navdata.NavData
         NavData instance containing L1 measurements for received GPS
         measurements.
-    ephemeris_path : string
+    ephemeris_path : pathlib.Path
         The location where ephemeris files are read from or downloaded to
         if they don't exist.
     """
@@ -316,7 +316,7 @@ def test_add_visible_svs_for_trajectory(android_gps_l1, ephemeris_path,
     android_gps_l1 : gnss_lib_py.navdata.navdata.NavData
         NavData instance containing L1 measurements for received GPS
         measurements.
-    ephemeris_path : string
+    ephemeris_path : pathlib.Path
         The location where ephemeris files are read from or downloaded to
         if they don't exist.
     error_tol_dec : Dict
@@ -402,7 +402,7 @@ def fixture_navdata_path(root_path):
 
     Parameters
     ----------
-    root_path : string
+    root_path : pathlib.Path
         Folder location containing measurements
 
     Returns
@@ -684,9 +684,9 @@ def test_compute_concat_precise_eph(navdata, sp3_path, clk_path):
     ----------
     navdata : pytest.fixture
         Instance of AndroidDerived for testing
-    sp3_path : string
+    sp3_path : pathlib.Path
         String with location for the unit_test sp3 measurements
-    clk_path : string
+    clk_path : pathlib.Path
         String with location for the unit_test clk measurements
     """
 
@@ -741,7 +741,7 @@ def fixture_all_ephem_paths(root_path):
 
     Parameters
     ----------
-    root_path : string
+    root_path : pathlib.Path
         Location where ephemeris files are stored/to be downloaded.
 
     Returns
@@ -769,9 +769,9 @@ def test_add_sv_states_precise(sp3_path,clk_path):
 
     Parameters
     ----------
-    sp3_path : string
+    sp3_path : pathlib.Path
         String with location for the unit_test sp3 measurements
-    clk_path : string
+    clk_path : pathlib.Path
         String with location for the unit_test clk measurements
 
     """
@@ -807,7 +807,7 @@ def test_add_sv_states_fails(all_ephem_paths,sp3_path):
     ----------
     all_ephem_paths : string
         Location of all unit test ephemeris files.
-    sp3_path : string
+    sp3_path : pathlib.Path
         String with location for the unit_test sp3 measurements
     """
 
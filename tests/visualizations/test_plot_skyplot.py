@@ -86,7 +86,7 @@ def test_skyplot_trim(root_path):
 
     Parameters
     ----------
-    root_path : string
+    root_path : pathlib.Path
         Folder location containing unit test data
 
     """